@@ -18,7 +18,9 @@ from config import (
 )
 from bot.thread_handler import (
     should_create_thread, create_thread_from_message,
-    process_thread_message, monitored_threads
+    process_thread_message,
+    handle_thread_update, handle_thread_delete, CLOSE_BUTTON_ID_PREFIX,
+    CloseThreadButton
 )
 from utils.logger import setup_logger
 
@@ -46,6 +48,11 @@ class ThreadBot(commands.Bot):
         # イベントリスナーの追加
         self.add_listeners()
         
+    async def setup_hook(self):
+        """ログイン前の初期化処理"""
+        # 締め切りボタンを永続化（custom_idから復元するため再起動後も機能する）
+        self.add_dynamic_items(CloseThreadButton)
+        
     def add_listeners(self):
         """イベントリスナーを追加"""
         
@@ -55,11 +62,22 @@ class ThreadBot(commands.Bot):
             # ボタンインタラクションのみを処理
             if interaction.type == discord.InteractionType.component:
                 # 締め切りボタンかどうかを確認
-                if interaction.data.get("custom_id", "").startswith("close_thread_"):
+                if interaction.data.get("custom_id", "").startswith(CLOSE_BUTTON_ID_PREFIX):
                     # ボタンのコールバックはボタンクラス内で処理されるため、
                     # ここでは追加のログ記録のみ行う
-                    logger.debug(f"締め切りボタンが押されました: ユーザー={interaction.user.display_name}, "
-                            f"チャンネル={interaction.channel.name if interaction.channel else 'unknown'}")
+                    logger.debug("締め切りボタンが押されました: ユーザー=%s, チャンネル=%s",
+                            interaction.user.display_name,
+                            interaction.channel.name if interaction.channel else 'unknown')
+        
+        @self.event
+        async def on_thread_update(before: discord.Thread, after: discord.Thread):
+            """スレッド更新時の処理（アーカイブ検知）"""
+            await handle_thread_update(before, after)
+        
+        @self.event
+        async def on_thread_delete(thread: discord.Thread):
+            """スレッド削除時の処理"""
+            await handle_thread_delete(thread)
         
     async def process_message(self, message: discord.Message):
         """
@@ -73,14 +91,15 @@ class ThreadBot(commands.Bot):
         
         # 無視するBotからのメッセージをスキップするロジックの前に追加
         if message.author.bot:
-            logger.debug(f"Botからのメッセージを検出: Bot ID={message.author.id}, 無視リスト={IGNORED_BOT_IDS}")
+            # 毎メッセージ通る経路のため、ログ出力時のみ文字列を組み立てる
+            logger.debug("Botからのメッセージを検出: Bot ID=%s, 無視リスト=%s", message.author.id, IGNORED_BOT_IDS)
 
             # 型変換を明示的に行って比較
             author_id = message.author.id
 
             # IGNORED_BOT_IDSがsetなので直接比較
             if author_id in IGNORED_BOT_IDS:
-                logger.debug(f"無視リストに含まれるBot (ID: {message.author.id}) からのメッセージをスキップします")
+                logger.debug("無視リストに含まれるBot (ID: %s) からのメッセージをスキップします", message.author.id)
                 return
             
         # スレッド作成条件をチェック
@@ -329,7 +348,7 @@ class ThreadBot(commands.Bot):
                 await ctx.send("⚠️ このコマンドは管理者のみ使用できます。")
                 return
                 
-            from bot.thread_handler import get_monitored_threads_status, monitored_threads
+            from bot.thread_handler import get_monitored_threads_status
             
             if not DEBUG_MODE:
                 await ctx.send("⚠️ デバッグモードが無効です。環境変数 `DEBUG_MODE=true` を設定してBotを再起動してください。")
@@ -5,17 +5,17 @@
 """
 
 import threading
-import discord
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Set, Tuple, NamedTuple
 import queue
 import time
+from collections import OrderedDict, deque
+from functools import partial
 from datetime import datetime, timezone, timedelta
-import random
 import traceback
 from config import (
     SPREADSHEET_LOGGING_ENABLED, SPREADSHEET_CREDENTIALS_FILE,
-    SPREADSHEET_ID, SPREADSHEET_SHEET_NAME, SPREADSHEET_LOG_QUEUE_SIZE,
-    THREAD_STATUS_CREATION, THREAD_STATUS_CLOSING,
+    SPREADSHEET_ID, SPREADSHEET_SHEET_NAME, SPREADSHEET_LOG_QUEUE_SIZE, SPREADSHEET_LOG_BATCH_SIZE,
+    SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS, SPREADSHEET_FIXED_VALUE, THREAD_STATUS_CREATION, THREAD_STATUS_CLOSING,
     SPREADSHEET_DAILY_LIMIT_ENABLED, SPREADSHEET_DAILY_RESET_HOUR, SPREADSHEET_TIMEZONE_OFFSET
 )
 from utils.spreadsheet_utils import SpreadsheetClient
@@ -23,22 +23,137 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class _LogRing:
+    """
+    複数プロデューサー・単一コンシューマー向けの軽量ログキュー
+    
+    deque の append/popleft はそれ自体がスレッドセーフなため、プロデューサー側では
+    queue.Queue のようなロック取得と notify を行わない。満杯時は最も古いエントリを
+    押し出す。
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        初期化
+        
+        Args:
+            maxsize: 保持する最大エントリ数
+        """
+        self._items = deque()
+        self._maxsize = maxsize
+        self._ready = threading.Event()
+    
+    def push(self, item):
+        """
+        エントリを追加（非ブロッキング）
+        
+        Args:
+            item: 追加するエントリ
+            
+        Returns:
+            満杯のため押し出された古いエントリ、なければNone
+        """
+        dropped = None
+        if len(self._items) >= self._maxsize:
+            try:
+                dropped = self._items.popleft()
+            except IndexError:
+                # 競合状態によりキューが空になった場合は無視
+                pass
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+        return dropped
+    
+    def pop(self, timeout: Optional[float] = None):
+        """
+        エントリを取り出す（空の場合は最大timeout秒待機、Noneなら追加されるまで待機）
+        
+        Raises:
+            queue.Empty: タイムアウトまでにエントリが追加されなかった場合
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        
+        # 待機前にフラグを下ろし、取りこぼしがないよう再確認する
+        self._ready.clear()
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        
+        self._ready.wait(timeout)
+        return self.pop_nowait()
+    
+    def pop_nowait(self):
+        """
+        エントリを取り出す（待機しない）
+        
+        Raises:
+            queue.Empty: キューが空の場合
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty
+    
+    def qsize(self) -> int:
+        """キュー内のエントリ数"""
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        """キューが空かどうか"""
+        return not self._items
+
+class _LogStatus(NamedTuple):
+    """ユーザーごとのログ記録状態（固定長のレコード）"""
+    status: str
+    timestamp: float  # time.time()の値（表示用の整形は読み出し時に行う）
+    username: str
+    log_type: str
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+class LogEntry(NamedTuple):
+    """キューに投入するログエントリ（プロデューサー側で全フィールドを確定させる）"""
+    user_id: int
+    username: str
+    status: str
+    row: Tuple[str, str, str, str]  # 書き込み用の行データ (ユーザーID, ユーザー名, 固定値, 状態)
+
 # スプレッドシートクライアントのシングルトンインスタンス
 _spreadsheet_client = None
 _client_lock = threading.Lock()
 
 # バックグラウンド処理用のキュー
-_log_queue = queue.Queue(maxsize=SPREADSHEET_LOG_QUEUE_SIZE)
+_log_queue = _LogRing(maxsize=SPREADSHEET_LOG_QUEUE_SIZE)
 _worker_thread = None
 _stop_worker = threading.Event()
+# ワーカーの稼働状態（ワーカー自身が開始時にセット、終了時にクリア）
+_worker_running = threading.Event()
+_worker_start_lock = threading.Lock()
+# 古いログ日付データのクリーンアップ間隔（秒）
+_CLEANUP_INTERVAL = 100.0
+# 1バッチの収集に掛ける最大時間（秒）
+_BATCH_MAX_LATENCY = SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS / 1000
 
 # ログ記録状態管理（ユーザーIDをキーとするステータス追跡）
-_logging_status: Dict[int, Dict] = {}
+# 書き込みはワーカーのみが行い、1件を1回の代入で置き換えるためロックは不要
+# 長時間稼働でも肥大化しないよう、最近更新された順に上限件数まで保持する（LRU）
+_logging_status: "OrderedDict[int, _LogStatus]" = OrderedDict()
+_LOGGING_STATUS_MAX = 10000
 
 # 1日1回制限用：ユーザーの最終ログ記録日を管理
 _user_last_log_date: Dict[int, str] = {}
 _daily_limit_lock = threading.Lock()
 
+# キュー投入済みで未処理のユーザーID（同一ユーザーの重複投入を防止）
+_in_flight: Set[int] = set()
+# 処理待ちのユーザーに後から届いたエントリ（処理待ちの書き込みが失敗した場合に代わりに投入する）
+_deferred: Dict[int, LogEntry] = {}
+
 def get_current_log_date() -> str:
     """
     現在の日付を1日1回制限用の基準で取得
@@ -84,7 +199,7 @@ def is_user_already_logged_today(user_id: int) -> bool:
         current_date = get_current_log_date()
         last_log_date = _user_last_log_date.get(user_id)
         
-        logger.debug(f"1日1回制限チェック: ユーザーID={user_id}, 現在日付={current_date}, 最終ログ日={last_log_date}")
+        logger.debug("1日1回制限チェック: ユーザーID=%s, 現在日付=%s, 最終ログ日=%s", user_id, current_date, last_log_date)
         
         return last_log_date == current_date
 
@@ -99,7 +214,45 @@ def update_user_log_date(user_id: int):
         current_date = get_current_log_date()
         _user_last_log_date[user_id] = current_date
         
-        logger.debug(f"ユーザーログ日付を更新: ユーザーID={user_id}, 日付={current_date}")
+        logger.debug("ユーザーログ日付を更新: ユーザーID=%s, 日付=%s", user_id, current_date)
+
+def _try_mark_in_flight(entry: LogEntry) -> bool:
+    """
+    ユーザーを処理待ちとして登録
+    すでに処理待ちの場合は、そのエントリの書き込みが失敗したときのためにエントリを保留する
+    
+    Args:
+        entry: 投入するログエントリ
+        
+    Returns:
+        bool: 登録できた場合はTrue、すでに処理待ちの場合はFalse
+    """
+    with _daily_limit_lock:
+        if entry.user_id in _in_flight:
+            # 先に届いたエントリを優先する
+            _deferred.setdefault(entry.user_id, entry)
+            return False
+        _in_flight.add(entry.user_id)
+        return True
+
+def _release_in_flight(user_id: int, retry_deferred: bool = False) -> Optional[LogEntry]:
+    """
+    ユーザーの処理待ち登録を解除
+    
+    Args:
+        user_id: ユーザーID
+        retry_deferred: 処理待ちのエントリを記録できなかったため、保留中のエントリを代わりに投入するか
+        
+    Returns:
+        Optional[LogEntry]: 代わりに投入する保留中のエントリ、なければNone
+        （この場合、処理待ち登録は解除せず保留中のエントリに引き継ぐ）
+    """
+    with _daily_limit_lock:
+        deferred = _deferred.pop(user_id, None)
+        if retry_deferred and deferred is not None:
+            return deferred
+        _in_flight.discard(user_id)
+        return None
 
 def cleanup_old_log_dates():
     """
@@ -122,7 +275,7 @@ def cleanup_old_log_dates():
             del _user_last_log_date[user_id]
         
         if users_to_remove:
-            logger.debug(f"古いログ日付データを削除しました: {len(users_to_remove)}件")
+            logger.debug("古いログ日付データを削除しました: %s件", len(users_to_remove))
 
 def get_spreadsheet_client() -> Optional[SpreadsheetClient]:
     """
@@ -133,6 +286,11 @@ def get_spreadsheet_client() -> Optional[SpreadsheetClient]:
     """
     global _spreadsheet_client
     
+    # 初期化済みの場合はロックを取得せずに返す
+    client = _spreadsheet_client
+    if client is not None:
+        return client
+    
     # ログ記録が無効な場合はNoneを返す
     if not SPREADSHEET_LOGGING_ENABLED:
         return None
@@ -146,7 +304,8 @@ def get_spreadsheet_client() -> Optional[SpreadsheetClient]:
     with _client_lock:
         # インスタンスがまだ作成されていない場合は新規作成
         if _spreadsheet_client is None:
-            _spreadsheet_client = SpreadsheetClient(
+            # 接続に成功するまでは公開しない（ロック外の高速パスから未接続のクライアントが見えないように）
+            client = SpreadsheetClient(
                 credentials_file=SPREADSHEET_CREDENTIALS_FILE,
                 spreadsheet_id=SPREADSHEET_ID,
                 sheet_name=SPREADSHEET_SHEET_NAME
@@ -154,15 +313,13 @@ def get_spreadsheet_client() -> Optional[SpreadsheetClient]:
             
             # 初期接続を試みる
             try:
-                connection_success = _spreadsheet_client.connect()
-                
-                if not connection_success:
+                if client.connect():
+                    _spreadsheet_client = client
+                else:
                     logger.error("スプレッドシートへの初期接続に失敗しました")
-                    _spreadsheet_client = None
                     
             except Exception as e:
                 logger.error(f"スプレッドシートクライアント初期化エラー: {e}")
-                _spreadsheet_client = None
     
     return _spreadsheet_client
 
@@ -170,133 +327,185 @@ def _start_worker_thread():
     """バックグラウンドワーカースレッドを開始"""
     global _worker_thread, _stop_worker
     
-    if _worker_thread is not None and _worker_thread.is_alive():
-        return
-    
-    # 既存のスレッドが存在しないか、停止している場合は新しいスレッドを開始
-    _stop_worker.clear()
-    _worker_thread = threading.Thread(
-        target=_log_worker,
-        daemon=True,
-        name="spreadsheet_logger_worker"
-    )
-    _worker_thread.start()
+    # 複数のプロデューサーが同時に停止を検知しても、ワーカーは1つだけ起動する
+    with _worker_start_lock:
+        if _worker_running.is_set():
+            return
+        
+        # 稼働状態はワーカー自身が管理するため、ここでは先にセットして二重起動を防ぐ
+        _worker_running.set()
+        _stop_worker.clear()
+        _worker_thread = threading.Thread(
+            target=_log_worker,
+            daemon=True,
+            name="spreadsheet_logger_worker"
+        )
+        _worker_thread.start()
     logger.info("スプレッドシートログ記録ワーカースレッドを開始しました")
 
 def _log_worker():
     """キューからログエントリを処理するワーカー関数"""
     logger.info("スプレッドシートログ記録ワーカーを開始しました")
+    _worker_running.set()
     
+    try:
+        _run_worker_loop()
+    finally:
+        _worker_running.clear()
+        logger.info("スプレッドシートログ記録ワーカーを終了しました")
+
+def _run_worker_loop():
+    """ワーカーのメインループ"""
     # 初期化
-    retry_count = 0
-    max_retries = 3
-    cleanup_counter = 0  # クリーンアップカウンター
+    next_cleanup = time.monotonic() + _CLEANUP_INTERVAL
+    client = None  # 取得できたクライアントはワーカー内で保持して使い回す
     
     while not _stop_worker.is_set():
         try:
-            # キューからログエントリを取得（タイムアウト付き）
+            # 古いログ日付データを定期的にクリーンアップ
+            # （ログ日付はエントリ処理時にしか増えないため、起床したときに判定すれば十分）
+            now = time.monotonic()
+            if now >= next_cleanup:
+                cleanup_old_log_dates()
+                next_cleanup = now + _CLEANUP_INTERVAL
+            
+            # キューからログエントリを取得（エントリが来るまで待機）
+            # 停止時は終了シグナルの投入で即座に起床する
             try:
-                log_entry = _log_queue.get(timeout=1.0)
+                log_entry = _log_queue.pop()
             except queue.Empty:
-                # キューが空の場合は次のループへ
-                # 100回に1回クリーンアップを実行
-                cleanup_counter += 1
-                if cleanup_counter >= 100:
-                    cleanup_old_log_dates()
-                    cleanup_counter = 0
                 continue
             
-            # 終了シグナルを検出
-            if log_entry is None:
-                logger.info("終了シグナルを受信しました。ワーカーを終了します。")
-                break
-                
-            # ログエントリを処理
-            user_id = log_entry.get("user_id")
-            username = log_entry.get("username", "不明")
-            fixed_value = log_entry.get("fixed_value", "")
-            status = log_entry.get("status", "募集作成")
-            
-            logger.debug(f"ログエントリ処理開始: ID={user_id}, ユーザー={username}, 状態={status}")
+            # 後続のエントリをバッチにまとめる（待機はせず、キューに溜まっている分だけ取り出す）
+            # 上限件数に達した、キューが空になった、収集開始から上限時間を超えた、のいずれかで打ち切る
+            # （閑散時は即座に書き込み、混雑時はまとめて書き込む。上限時間はエントリが
+            # 途切れず届き続ける場合に収集を打ち切るためのもの）
+            batch = [log_entry]
+            deadline = time.monotonic() + _BATCH_MAX_LATENCY
+            while (batch[-1] is not None
+                   and len(batch) < SPREADSHEET_LOG_BATCH_SIZE
+                   and time.monotonic() < deadline):
+                try:
+                    batch.append(_log_queue.pop_nowait())
+                except queue.Empty:
+                    break
             
-            # 1日1回制限チェック
-            if is_user_already_logged_today(user_id):
-                logger.info(f"1日1回制限により記録をスキップ: ユーザーID={user_id}, ユーザー={username}")
-                with _client_lock:
-                    _logging_status[user_id] = {
-                        "status": "skipped_daily_limit",
-                        "timestamp": datetime.now().isoformat(),
-                        "username": username,
-                        "log_type": status,
-                        "message": "1日1回制限により記録をスキップしました"
-                    }
-                _log_queue.task_done()
-                continue
+            # 終了シグナルを検出（バッチ内の残りは処理してから終了する）
+            stop_requested = None in batch
+            entries = [entry for entry in batch if entry is not None]
             
-            # クライアントを取得
-            client = get_spreadsheet_client()
-            if client is None:
-                logger.error(f"スプレッドシートクライアントが利用できません: {log_entry}")
-                _log_queue.task_done()
-                continue
+            # クライアントが未取得の場合のみ取得する
+            if client is None and entries:
+                client = get_spreadsheet_client()
             
-            # 処理成功フラグとリトライカウンタをリセット
-            processing_success = False
-            retry_count = 0
-            
-            # スプレッドシートに記録（同期処理）
+            # ログエントリをまとめて処理
+            # 記録できなかったユーザーに保留中のエントリがあれば、代わりにキューへ投入する
+            settled = set()
             try:
-                # 同期処理を実行
-                result = client.add_thread_log(
-                    user_id=str(user_id),
-                    username=username,
-                    fixed_value=fixed_value,
-                    status=status
-                )
-                
-                # 成功
-                processing_success = True
-                
-                # 成功した場合のみユーザーのログ記録日を更新
-                if result:
-                    update_user_log_date(user_id)
-                
-                # 結果を保存
-                with _client_lock:
-                    _logging_status[user_id] = {
-                        "status": "success" if result else "failed",
-                        "timestamp": datetime.now().isoformat(),
-                        "username": username,
-                        "log_type": status,
-                        "retries": retry_count
-                    }
-                
-                logger.info(f"スレッドログを記録しました: ID={user_id}, ユーザー={username}, 状態={status}, 結果={result}")
-            
-            except Exception as e:
-                # エラー処理
-                logger.error(f"ログ記録処理エラー: {e}")
-                with _client_lock:
-                    _logging_status[user_id] = {
-                        "status": "error",
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat(),
-                        "username": username,
-                        "log_type": status,
-                        "retries": retry_count
-                    }
+                settled = _process_log_batch(entries, client)
+            finally:
+                for entry in entries:
+                    deferred = _release_in_flight(entry.user_id, retry_deferred=entry.user_id not in settled)
+                    if deferred is not None:
+                        logger.info("記録できなかったため保留中のエントリを投入します: ユーザーID=%s, 状態=%s", deferred.user_id, deferred.status)
+                        _push_entry(deferred)
             
-            # タスク完了を通知
-            _log_queue.task_done()
+            if stop_requested:
+                logger.info("終了シグナルを受信しました。ワーカーを終了します。")
+                break
                 
         except Exception as e:
             # ワーカーループの最上位例外ハンドラ
             logger.error(f"ワーカースレッドでの予期しないエラー: {e}")
             logger.debug(f"エラー詳細:\n{traceback.format_exc()}")
-            # エラーが発生しても処理を継続するため短時間待機
-            time.sleep(1)
+            # エラーが発生しても処理を継続するため短時間待機（停止要求があれば即座に抜ける）
+            _stop_worker.wait(1.0)
+
+def _process_log_batch(entries: List[LogEntry], client: Optional[SpreadsheetClient]) -> Set[int]:
+    """
+    ログエントリをまとめてスプレッドシートに記録
+    
+    Args:
+        entries: 処理対象のログエントリのリスト
+        client: スプレッドシートクライアント（利用できない場合はNone）
+        
+    Returns:
+        Set[int]: 記録済み、または1日1回制限でスキップしたユーザーIDの集合
+    """
+    settled = set()
+    if not entries:
+        return settled
+    
+    logger.debug("ログエントリ処理開始: %s件", len(entries))
+    
+    # 記録状態のタイムスタンプはバッチ内で共通の値を使う
+    now = time.time()
     
-    logger.info("スプレッドシートログ記録ワーカーを終了しました")
+    # 1日1回制限チェック（記録対象のみ残す）
+    pending = []
+    for entry in entries:
+        if is_user_already_logged_today(entry.user_id):
+            logger.info(f"1日1回制限により記録をスキップ: ユーザーID={entry.user_id}, ユーザー={entry.username}")
+            _set_logging_status(entry, now, "skipped_daily_limit", message="1日1回制限により記録をスキップしました")
+            settled.add(entry.user_id)
+        else:
+            pending.append(entry)
+    
+    if not pending:
+        return settled
+    
+    # クライアントが利用できない場合は破棄
+    if client is None:
+        logger.error(f"スプレッドシートクライアントが利用できません: {len(pending)}件のログを破棄します")
+        return settled
+    
+    # スプレッドシートにまとめて記録（同期処理）
+    try:
+        result = client.add_thread_logs([entry.row for entry in pending])
+        
+        now = time.time()
+        for entry in pending:
+            # 成功した場合のみユーザーのログ記録日を更新
+            if result:
+                update_user_log_date(entry.user_id)
+                settled.add(entry.user_id)
+            
+            # 結果を保存
+            _set_logging_status(entry, now, "success" if result else "failed")
+        
+        logger.info(f"スレッドログを記録しました: {len(pending)}件, 結果={result}")
+    
+    except Exception as e:
+        # エラー処理
+        logger.error(f"ログ記録処理エラー: {e}")
+        now = time.time()
+        for entry in pending:
+            _set_logging_status(entry, now, "error", error=str(e))
+    
+    return settled
+
+def _set_logging_status(entry: LogEntry, timestamp: float, status: str, message: Optional[str] = None, error: Optional[str] = None):
+    """
+    ユーザーのログ記録状態を保存（ワーカースレッドからのみ呼び出す）
+    
+    Args:
+        entry: 対象のログエントリ
+        timestamp: 記録時刻（time.time()の値）
+        status: 記録結果（success/failed/error/skipped_daily_limit）
+        message: 補足メッセージ
+        error: エラー内容
+    """
+    _logging_status[entry.user_id] = _LogStatus(
+        status=status,
+        timestamp=timestamp,
+        username=entry.username,
+        log_type=entry.status,
+        message=message,
+        error=error
+    )
+    _logging_status.move_to_end(entry.user_id)
+    if len(_logging_status) > _LOGGING_STATUS_MAX:
+        _logging_status.popitem(last=False)
 
 def stop_worker():
     """ワーカースレッドを停止"""
@@ -306,15 +515,40 @@ def stop_worker():
     _stop_worker.set()
     
     # 終了シグナルをキューに送信
-    try:
-        _log_queue.put(None, block=False)
-    except queue.Full:
-        pass
+    _push_entry(None)
     
     # ワーカースレッドが存在し、実行中なら終了を待機
     if _worker_thread is not None and _worker_thread.is_alive():
         _worker_thread.join(timeout=5.0)
         logger.info("スプレッドシートログ記録ワーカーが終了しました")
+    
+    # ワーカーが終了していれば、処理されずに残ったエントリを破棄して処理待ち登録を解除する
+    # （終了待ちがタイムアウトした場合は、ワーカーと取り合わないよう何もしない）
+    if _worker_thread is None or not _worker_thread.is_alive():
+        discarded = 0
+        while True:
+            try:
+                entry = _log_queue.pop_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                _release_in_flight(entry.user_id)
+                discarded += 1
+        if discarded:
+            logger.warning(f"未処理のログエントリを破棄しました: {discarded}件")
+
+def _push_entry(entry: Optional[LogEntry]):
+    """
+    エントリをキューに追加（非ブロッキング、満杯の場合は古いエントリを押し出す）
+    
+    Args:
+        entry: 追加するログエントリ（Noneは終了シグナル）
+    """
+    old_entry = _log_queue.push(entry)
+    if old_entry is not None:
+        # 押し出されたエントリは記録されないため、処理待ち登録も解除する
+        logger.warning(f"キューが満杯のため古いエントリを削除: ID={old_entry.user_id}")
+        _release_in_flight(old_entry.user_id)
 
 def queue_thread_log(user_id: int, username: str, status: str = THREAD_STATUS_CREATION) -> bool:
     """
@@ -329,82 +563,42 @@ def queue_thread_log(user_id: int, username: str, status: str = THREAD_STATUS_CR
     Returns:
         bool: キューへの追加成功時はTrue、制限によりスキップした場合もTrue
     """
-    # ログ記録が無効な場合は何もせずにTrueを返す
-    if not SPREADSHEET_LOGGING_ENABLED:
-        return True
-    
     # 1日1回制限の事前チェック
     if is_user_already_logged_today(user_id):
         logger.info(f"1日1回制限により記録をスキップ（事前チェック）: ユーザーID={user_id}, ユーザー={username}, 状態={status}")
         return True  # 制限によりスキップしたが、エラーではないのでTrueを返す
     
-    # ワーカースレッドの状態確認と再開
-    global _worker_thread, _stop_worker
+    # ログエントリを作成
+    # 書き込み用の行データはプロデューサー側で組み立て、ワーカーはそのまま送るだけにする
+    log_entry = LogEntry(
+        user_id, username, status,
+        (str(user_id), username, SPREADSHEET_FIXED_VALUE, status)
+    )
     
-    if _worker_thread is None or not _worker_thread.is_alive():
+    # 同一ユーザーのエントリがすでにキューにある場合は重複投入せずに保留する
+    # （1日1回制限が有効なら、先のエントリを記録できた時点で後続のエントリは不要になる。
+    # 記録できなかった場合はワーカーが保留中のエントリを代わりに投入する）
+    if SPREADSHEET_DAILY_LIMIT_ENABLED and not _try_mark_in_flight(log_entry):
+        logger.debug("処理待ちのエントリがあるため記録を保留: ユーザーID=%s, ユーザー=%s, 状態=%s", user_id, username, status)
+        return True
+    
+    # ワーカースレッドの状態確認と再開
+    if not _worker_running.is_set():
         logger.info("ワーカースレッドが停止しています。再起動します。")
-        _stop_worker.clear()
         _start_worker_thread()
     
-    # ログエントリを作成
-    log_entry = {
-        "user_id": user_id,
-        "username": username,
-        "status": status,
-        "timestamp": datetime.now().isoformat()
-    }
-    
-    # キューに追加（非ブロッキング）
-    try:
-        _log_queue.put(log_entry, block=False)
-        logger.debug(f"スレッドログをキューに追加しました: ID={user_id}, ユーザー={username}, 状態={status}")
-        return True
-    except queue.Full:
-        # キューが満杯の場合、古いエントリを削除して空きを作る
-        try:
-            try:
-                # まず古いエントリを取り出す
-                old_entry = _log_queue.get(block=False)
-                logger.warning(f"キューが満杯のため古いエントリを削除: ID={old_entry.get('user_id')}")
-                _log_queue.task_done()  # タスク完了を通知
-            except queue.Empty:
-                # 競合状態によりキューが空の場合は無視
-                pass
-            
-            # 再度追加を試みる
-            _log_queue.put(log_entry, block=False)
-            logger.debug(f"スレッドログをキューに追加しました(2回目の試行): ID={user_id}, ユーザー={username}")
-            return True
-        except Exception as e:
-            logger.error(f"キュー操作中にエラー: {e}")
-            logger.warning(f"ログキューがいっぱいです。ログを破棄します: ID={user_id}, ユーザー={username}")
-            return False
-
-def log_thread_creation(user_id: int, username: str) -> bool:
-    """
-    スレッド作成をログ記録キューに追加
+    # キューに追加（非ブロッキング、満杯の場合は古いエントリを押し出す）
+    # 呼び出し元のイベントループから直接プッシュするため、run_in_executor等を経由した
+    # contextvarsのコピーは発生しない
+    _push_entry(log_entry)
     
-    Args:
-        user_id: ユーザーID
-        username: ユーザー名
-        
-    Returns:
-        bool: キューへの追加成功時はTrue
-    """
-    return queue_thread_log(user_id, username, THREAD_STATUS_CREATION)
+    logger.debug("スレッドログをキューに追加しました: ID=%s, ユーザー=%s, 状態=%s", user_id, username, status)
+    return True
 
-def log_thread_close(user_id: int, username: str) -> bool:
-    """
-    スレッド締め切りをログ記録キューに追加
-    
-    Args:
-        user_id: ユーザーID
-        username: ユーザー名
-        
-    Returns:
-        bool: キューへの追加成功時はTrue
-    """
-    return queue_thread_log(user_id, username, THREAD_STATUS_CLOSING)
+# スレッド作成・締め切りをログ記録キューに追加（引数: user_id, username）
+# 状態を事前に束縛し、呼び出しごとのラッパー関数のフレームを省く
+log_thread_creation = partial(queue_thread_log, status=THREAD_STATUS_CREATION)
+log_thread_close = partial(queue_thread_log, status=THREAD_STATUS_CLOSING)
 
 def get_log_status(user_id: int) -> Optional[Dict]:
     """
@@ -416,8 +610,13 @@ def get_log_status(user_id: int) -> Optional[Dict]:
     Returns:
         Optional[Dict]: ログ記録状態の辞書、存在しない場合はNone
     """
-    with _client_lock:
-        return _logging_status.get(user_id)
+    record = _logging_status.get(user_id)
+    if record is None:
+        return None
+    
+    status = {key: value for key, value in record._asdict().items() if value is not None}
+    status["timestamp"] = datetime.fromtimestamp(record.timestamp).isoformat()
+    return status
 
 def get_daily_limit_status() -> Dict:
     """
@@ -443,8 +642,17 @@ def cleanup():
     # 1日1回制限データもクリーンアップ
     with _daily_limit_lock:
         _user_last_log_date.clear()
+        _in_flight.clear()
+        _deferred.clear()
     logger.info("スプレッドシートログ記録モジュールをクリーンアップしました")
 
+def _noop_log(*args, **kwargs) -> bool:
+    """ログ記録が無効な場合の代替関数（何もせずにTrueを返す）"""
+    return True
+
 # モジュールロード時にワーカースレッドを開始
 if SPREADSHEET_LOGGING_ENABLED:
-    _start_worker_thread()
\ No newline at end of file
+    _start_worker_thread()
+else:
+    # ログ記録が無効な場合は公開関数を差し替え、呼び出しごとの有効判定を省く
+    queue_thread_log = log_thread_creation = log_thread_close = _noop_log
\ No newline at end of file
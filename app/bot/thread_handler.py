@@ -5,41 +5,160 @@
 """
 
 import discord
-from discord.ui import Button, View
-from typing import List, Optional, Dict
+from discord.ui import Button, View, DynamicItem
+from typing import List, Optional, Dict, Tuple
 import re
 import asyncio
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from utils.logger import setup_logger
-from config import DEBUG_MODE
+from config import (
+    DEBUG_MODE, TRIGGER_KEYWORDS, THREAD_CLOSE_KEYWORDS, THREAD_CLOSED_NAME_TEMPLATE,
+    VALID_ARCHIVE_DURATIONS
+)
+
+# 解決済みのスプレッドシートロガー関数（初回呼び出し時に設定）
+_LOGGER_FNS = None
 
 # スプレッドシートロガーをインポート（遅延インポート）
 def get_spreadsheet_logger():
-    """スプレッドシートロガーを取得（遅延インポート）"""
-    try:
-        from bot.spreadsheet_logger import log_thread_creation, log_thread_close
-        return log_thread_creation, log_thread_close
-    except ImportError:
-        logger.warning("スプレッドシートロガーモジュールがインポートできませんでした")
-        # ダミー関数を返す
-        dummy = lambda *args, **kwargs: False
-        return dummy, dummy
+    """スプレッドシートロガーを取得（遅延インポート、結果はキャッシュ）"""
+    global _LOGGER_FNS
+    
+    if _LOGGER_FNS is None:
+        try:
+            from bot.spreadsheet_logger import log_thread_creation, log_thread_close
+            _LOGGER_FNS = (log_thread_creation, log_thread_close)
+        except ImportError:
+            logger.warning("スプレッドシートロガーモジュールがインポートできませんでした")
+            # ダミー関数を返す
+            dummy = lambda *args, **kwargs: False
+            _LOGGER_FNS = (dummy, dummy)
+    return _LOGGER_FNS
     
 
 logger = setup_logger(__name__)
 
-# スレッド監視状態を追跡するディクショナリ
-# キー：スレッドID、値：監視タスク
-monitored_threads: Dict[int, asyncio.Task] = {}
+class ThreadRecord:
+    """Botが作成したスレッドの管理情報"""
+    
+    __slots__ = (
+        'creator_id', 'timer_handle', 'created_at', 'created_at_str', 'end_monitoring_time',
+        'name', 'author', 'auto_archive_duration', 'monitoring_duration'
+    )
+    
+    def __init__(
+        self,
+        creator_id: Optional[int],
+        name: str,
+        author: str,
+        auto_archive_duration: int,
+        monitoring_duration: int
+    ):
+        """
+        管理情報の初期化
+        
+        Args:
+            creator_id: スレッド作成者のユーザーID
+            name: スレッド名
+            author: スレッド作成者の名前
+            auto_archive_duration: 自動アーカイブ時間（分）
+            monitoring_duration: 監視時間（分）
+        """
+        self.creator_id = creator_id
+        self.timer_handle: Optional[asyncio.TimerHandle] = None
+        self.created_at = time.time()
+        # 表示用の作成日時（状態取得のたびに整形しないよう作成時に1回だけ生成）
+        self.created_at_str = datetime.fromtimestamp(self.created_at).strftime('%Y-%m-%d %H:%M:%S')
+        self.end_monitoring_time = self.created_at + (monitoring_duration * 60)
+        self.name = name
+        self.author = author
+        self.auto_archive_duration = auto_archive_duration
+        self.monitoring_duration = monitoring_duration
+
+# Botが作成したスレッドの管理情報
+# キー：スレッドID、値：ThreadRecord（作成者・監視終了タイマー・デバッグ情報）
+thread_records: Dict[int, ThreadRecord] = {}
+
+# @[数値]パターン（例: @1, @123, ＠１, ＠１２３など）
+# 全角の＠・数字は_FULLWIDTH_TRANSで半角に正規化してから検索する
+AT_NUMBER_PATTERN = re.compile(r'@[0-9]+')
+_FULLWIDTH_TRANS = str.maketrans("０１２３４５６７８９＠", "0123456789@")
+
+# スレッド名の「[✅ 募集中]」タグ
+RECRUITMENT_TAG_PATTERN = re.compile(r'\[✅\s*募集中\]')
+
+@lru_cache(maxsize=32)
+def _fold_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    キーワード群を大文字小文字を区別しない比較用に正規化（casefold）
+    
+    Args:
+        keywords: キーワードのタプル
+        
+    Returns:
+        Tuple[str, ...]: casefold済みのキーワード（空文字は除外）
+    """
+    return tuple(keyword.casefold() for keyword in keywords if keyword)
+
+def _contains_keyword(text: str, keywords: List[str]) -> bool:
+    """
+    テキストにいずれかのキーワードが含まれるか（大文字小文字を区別しない）
+    
+    Args:
+        text: チェック対象のテキスト
+        keywords: キーワードのリスト
+        
+    Returns:
+        bool: いずれかのキーワードが含まれる場合はTrue
+    """
+    folded = _fold_keywords(tuple(keywords))
+    if not folded:
+        return False
+    text_cf = text.casefold()
+    return any(keyword in text_cf for keyword in folded)
+
+def reload_keyword_cache(
+    trigger_keywords: List[str] = TRIGGER_KEYWORDS,
+    close_keywords: List[str] = THREAD_CLOSE_KEYWORDS
+) -> None:
+    """
+    キーワードのキャッシュを破棄し、設定中のキーワードで再生成
+    
+    Args:
+        trigger_keywords: トリガーとなるキーワードのリスト
+        close_keywords: 締め切りトリガーとなるキーワードのリスト
+    """
+    _fold_keywords.cache_clear()
+    
+    # 最初のメッセージ処理時に正規化が走らないよう事前に生成しておく
+    _fold_keywords(tuple(trigger_keywords))
+    _fold_keywords(tuple(close_keywords))
 
-# スレッド作成者を追跡するディクショナリ
-thread_creators = {}  # キー: スレッドID、値: 作成者のユーザーID
+# 設定読み込み時にキーワードを正規化
+reload_keyword_cache()
 
-# デバッグ情報を保持する辞書
-# キー：スレッドID、値：{'created_at': タイムスタンプ, 'end_time': 監視終了タイムスタンプ}
-thread_debug_info: Dict[int, Dict] = {}
+# 締め切りマーカーのキャッシュ（キー: テンプレート、値: マーカー文字列）
+_close_marker_cache: Dict[str, str] = {}
+
+def _close_marker(closed_name_template: str) -> str:
+    """
+    締め切り後のスレッド名テンプレートから締め切りマーカーを取得（テンプレートごとに1回だけ生成）
+    
+    Args:
+        closed_name_template: 締め切り後のスレッド名テンプレート
+        
+    Returns:
+        str: 締め切り済みスレッド名に含まれるマーカー文字列
+    """
+    marker = _close_marker_cache.get(closed_name_template)
+    if marker is None:
+        marker = _close_marker_cache.setdefault(
+            closed_name_template, closed_name_template.format(original_name="").strip()
+        )
+    return marker
 
 def should_create_thread(message: discord.Message, trigger_keywords: List[str]) -> bool:
     """
@@ -52,23 +171,19 @@ def should_create_thread(message: discord.Message, trigger_keywords: List[str])
     Returns:
         bool: スレッドを作成すべき場合はTrue
     """
-    # メッセージ内容が空の場合は無視
-    if not message.content:
+    # メッセージ内容が空の場合やサーバー外（DM）の場合は無視
+    # （Botのメッセージは無視リストに含まれない限り対象なのでここでは除外しない）
+    if not message.content or message.guild is None:
         return False
     
-    # @[数値]パターンのチェック（例: @1, @123, ＠１, ＠１２３など、半角・全角両対応）
-    at_number_pattern = re.compile(r'[@＠][0-9０-９]+')
-    if at_number_pattern.search(message.clean_content):
-        return True
+    text = message.clean_content
     
-    # メッセージ内容にトリガーキーワードが含まれるかチェック
-    for keyword in trigger_keywords:
-        # 大文字小文字を区別せずにキーワードを検索
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        if pattern.search(message.clean_content):
-            return True
+    # @[数値]パターンのチェック（@/＠を含まないメッセージでは正規表現を使わない）
+    if ('@' in text or '＠' in text) and AT_NUMBER_PATTERN.search(text.translate(_FULLWIDTH_TRANS)):
+        return True
     
-    return False
+    # メッセージ内容にトリガーキーワードが含まれるかチェック（大文字小文字を区別しない）
+    return _contains_keyword(text, trigger_keywords)
 
 def should_close_thread(message: discord.Message, close_keywords: List[str]) -> bool:
     """
@@ -85,14 +200,10 @@ def should_close_thread(message: discord.Message, close_keywords: List[str]) ->
     if not message.content:
         return False
     
-    # メッセージ内容に締め切りキーワードが含まれるかチェック
-    for keyword in close_keywords:
-        # 大文字小文字を区別せずにキーワードを検索
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        if pattern.search(message.content):
-            return True
+    text = message.content
     
-    return False
+    # メッセージ内容に締め切りキーワードが含まれるかチェック（大文字小文字を区別しない）
+    return _contains_keyword(text, close_keywords)
 
 async def create_thread_from_message(
     message: discord.Message, 
@@ -128,10 +239,16 @@ async def create_thread_from_message(
                 auto_archive_duration = 10080
                 
         # Discord APIが許可する有効な値のみを使用（60, 1440, 4320, 10080）
-        valid_archive_durations = [60, 1440, 4320, 10080]
-        if auto_archive_duration not in valid_archive_durations:
-            # 最も近い有効な値を選択
-            auto_archive_duration = min(valid_archive_durations, key=lambda x: abs(x - auto_archive_duration))
+        if auto_archive_duration not in VALID_ARCHIVE_DURATIONS:
+            # 最も近い有効な値を選択（各境界は隣り合う有効値の中間点）
+            if auto_archive_duration <= 750:
+                auto_archive_duration = 60
+            elif auto_archive_duration <= 2880:
+                auto_archive_duration = 1440
+            elif auto_archive_duration <= 7200:
+                auto_archive_duration = 4320
+            else:
+                auto_archive_duration = 10080
             logger.info(f"auto_archive_durationを有効な値 {auto_archive_duration} に調整しました")
                 
         if isinstance(monitoring_duration, str):
@@ -150,7 +267,14 @@ async def create_thread_from_message(
         logger.info(f"スレッド '{name}' を作成しました (ID: {thread.id})")
         
         # スレッド作成者情報を保存
-        thread_creators[thread.id] = message.author.id
+        record = ThreadRecord(
+            creator_id=message.author.id,
+            name=name,
+            author=message.author.name,
+            auto_archive_duration=auto_archive_duration,
+            monitoring_duration=monitoring_duration
+        )
+        thread_records[thread.id] = record
 
         # スプレッドシートにログ記録（非同期・非ブロッキング）
         try:
@@ -164,7 +288,7 @@ async def create_thread_from_message(
             )
             
             if log_result:
-                logger.debug(f"スレッド作成ログをキューに追加しました: ID={thread.id}, ユーザー={message.author.name}")
+                logger.debug("スレッド作成ログをキューに追加しました: ID=%s, ユーザー=%s", thread.id, message.author.name)
             
         except Exception as e:
             logger.error(f"スプレッドシートログ記録エラー: {e}")
@@ -174,7 +298,7 @@ async def create_thread_from_message(
         # 締め切りボタンを含むメッセージを送信
         try:
             # ボタンビューを作成 - 作成者IDも渡す
-            view = CloseThreadView(thread.id, closed_name_template, message.author.id)
+            view = CloseThreadView(thread.id, message.author.id)
             
             # メッセージを送信
             await thread.send(
@@ -185,39 +309,21 @@ async def create_thread_from_message(
         except Exception as e:
             logger.error(f"締め切りボタン送信エラー: {e}")
         
-        # デバッグ情報を設定
+        # デバッグ情報をログに出力
         if DEBUG_MODE:
-            created_at = time.time()
-            end_monitoring_time = created_at + (monitoring_duration * 60)
-            thread_debug_info[thread.id] = {
-                'created_at': created_at,
-                'end_monitoring_time': end_monitoring_time,
-                'auto_archive_duration': auto_archive_duration,
-                'name': name,
-                'author': message.author.name,
-                'author_id': message.author.id,  # 作成者IDも保存
-                'monitoring_duration': monitoring_duration
-            }
-            
-            # デバッグ情報をログに出力
-            logger.debug(f"スレッド作成デバッグ情報: ID={thread.id}, 作成者={message.author.display_name}, "
-                        f"作成者ID={message.author.id}, "
-                        f"アーカイブ時間={auto_archive_duration}分, 監視時間={monitoring_duration}分")
+            logger.debug("スレッド作成デバッグ情報: ID=%s, 作成者=%s, 作成者ID=%s, アーカイブ時間=%s分, 監視時間=%s分",
+                         thread.id, message.author.display_name, message.author.id,
+                         auto_archive_duration, monitoring_duration)
         
-        # スレッド監視タスクを開始
+        # スレッド監視を開始
         if monitoring_duration > 0 and bot is not None:
-            # 監視タスクを開始
-            monitor_task = asyncio.create_task(
-                monitor_thread(
-                    bot=bot,
-                    thread=thread,
-                    monitoring_duration=monitoring_duration,
-                    close_keywords=close_keywords,
-                    closed_name_template=closed_name_template
-                )
+            # 監視終了タイマーを登録
+            record.timer_handle = monitor_thread(
+                bot=bot,
+                thread=thread,
+                monitoring_duration=monitoring_duration,
+                closed_name_template=closed_name_template
             )
-            # タスクを監視リストに追加
-            monitored_threads[thread.id] = monitor_task
             logger.info(f"スレッド '{name}' (ID: {thread.id}) の監視を開始しました（監視時間: {monitoring_duration}分）")
         
         return thread
@@ -253,9 +359,7 @@ async def close_thread(
         
         # 「[✅ 募集中]」タグが含まれている場合は除去
         # 正規表現を使用して柔軟に対応
-        import re
-        recruitment_tag_pattern = re.compile(r'\[✅\s*募集中\]')
-        clean_name = recruitment_tag_pattern.sub('', original_name).strip()
+        clean_name = RECRUITMENT_TAG_PATTERN.sub('', original_name).strip()
         
         # 新しいスレッド名を生成
         new_name = closed_name_template.format(original_name=clean_name)
@@ -269,13 +373,14 @@ async def close_thread(
         await thread.edit(name=new_name)
         
         # スレッド作成者情報を削除（スレッドが閉じられたため）
-        if thread.id in thread_creators:
-            del thread_creators[thread.id]
+        record = thread_records.get(thread.id)
+        if record is not None and record.creator_id is not None:
+            record.creator_id = None
             
             # スプレッドシートにログ記録（非同期・非ブロッキング）
             try:
                 # スレッド作成者情報があれば、その情報でログを残す
-                author_id = thread_creators.get(thread.id)
+                author_id = record.creator_id
                 if author_id:
                     # スレッド作成者のユーザーオブジェクトを取得
                     guild = thread.guild
@@ -293,7 +398,7 @@ async def close_thread(
                             )
                             
                             if log_result:
-                                logger.debug(f"スレッド締め切りログをキューに追加しました: ID={thread.id}, ユーザー={username}")
+                                logger.debug("スレッド締め切りログをキューに追加しました: ID=%s, ユーザー=%s", thread.id, username)
             except Exception as e:
                 logger.error(f"スプレッドシートログ記録エラー: {e}")
             logger.info(f"スレッド '{original_name}' (ID: {thread.id}) の作成者情報を削除しました")
@@ -312,143 +417,191 @@ async def close_thread(
     
     return False
 
-async def monitor_thread(
+# デバッグモードで監視状態をログ出力する間隔（秒）
+DEBUG_LOG_INTERVAL = 30 * 60
+
+# 実行中の終了処理タスク（GCで回収されないよう参照を保持）
+_finalize_tasks = set()
+
+# 全スレッド共通のデバッグログ用タイマー
+_debug_ticker: Optional[asyncio.TimerHandle] = None
+
+def monitor_thread(
     bot: discord.Client,
     thread: discord.Thread,
     monitoring_duration: int,
-    close_keywords: List[str],
     closed_name_template: str
-) -> None:
+) -> asyncio.TimerHandle:
     """
-    スレッドを監視し、必要に応じてスレッド名を変更
+    監視時間の終了時にスレッドを締め切るタイマーを登録
     
     Args:
         bot: Discordボットインスタンス
         thread: 監視対象のスレッド
         monitoring_duration: 監視時間（分）
-        close_keywords: 締め切りトリガーキーワード
+        closed_name_template: 締め切り後のスレッド名テンプレート
+        
+    Returns:
+        asyncio.TimerHandle: 監視終了タイマーのハンドル
+    """
+    loop = asyncio.get_running_loop()
+    
+    # 締め切り・削除などで監視を中止した場合は_stop_monitoringでタイマーごと取り消される
+    def _on_deadline():
+        task = loop.create_task(_finalize(bot, thread, closed_name_template))
+        _finalize_tasks.add(task)
+        task.add_done_callback(_finalize_tasks.discard)
+    
+    handle = loop.call_later(monitoring_duration * 60, _on_deadline)
+    
+    if DEBUG_MODE:
+        _start_debug_ticker(loop)
+    
+    logger.info(f"スレッド '{thread.name}' (ID: {thread.id}) の監視を開始しました")
+    return handle
+
+async def _finalize(
+    bot: discord.Client,
+    thread: discord.Thread,
+    closed_name_template: str
+) -> None:
+    """
+    監視時間終了時の処理（締め切り・退出・監視情報の削除）
+    
+    Args:
+        bot: Discordボットインスタンス
+        thread: 監視対象のスレッド
         closed_name_template: 締め切り後のスレッド名テンプレート
     """
     thread_id = thread.id
-    is_closed = False
     
     try:
-        # スレッドが見つからない場合は終了
-        if not thread:
-            logger.warning(f"監視対象のスレッド（ID: {thread_id}）が見つかりません")
-            return
-            
-        logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) の監視を開始しました")
-        
-        # 監視終了時間 (秒)
-        end_time = asyncio.get_event_loop().time() + (monitoring_duration * 60)
-        
-        # デバッグモードでログ間隔 (デフォルト30分ごと)
-        debug_log_interval = 30 * 60  # 30分
-        next_debug_log = asyncio.get_event_loop().time() + debug_log_interval
-        
-        # 監視ループ
-        while asyncio.get_event_loop().time() < end_time:
-            # デバッグモードの場合、定期的にステータスをログ出力
-            current_time = asyncio.get_event_loop().time()
-            if DEBUG_MODE and current_time >= next_debug_log:
-                # スレッド情報を更新
-                try:
-                    refreshed_thread = await bot.fetch_channel(thread_id)
-                    if refreshed_thread and isinstance(refreshed_thread, discord.Thread):
-                        thread = refreshed_thread
-                        
-                        # アーカイブまでの残り時間（分）を計算
-                        archive_timestamp = thread.archive_timestamp
-                        if archive_timestamp:
-                            now = datetime.now()
-                            archive_time = archive_timestamp.replace(tzinfo=None)
-                            if archive_time > now:
-                                minutes_to_archive = int((archive_time - now).total_seconds() / 60)
-                                
-                                # 残り監視時間（分）を計算
-                                minutes_to_end_monitoring = int((end_time - current_time) / 60)
-                                
-                                # ログ出力
-                                logger.debug(
-                                    f"スレッド監視中: '{thread.name}' (ID: {thread_id}), "
-                                    f"アーカイブまで残り {minutes_to_archive}分, "
-                                    f"監視終了まで残り {minutes_to_end_monitoring}分"
-                                )
-                except Exception as e:
-                    logger.debug(f"スレッド情報取得エラー (ID: {thread_id}): {e}")
-                
-                # 次のログ出力時間を設定
-                next_debug_log = current_time + debug_log_interval
-            
-            # スレッドが存在しなくなった場合は終了
-            try:
-                # fetch_channelでスレッドの状態を更新
-                refreshed_thread = await bot.fetch_channel(thread_id)
-                if not refreshed_thread or not isinstance(refreshed_thread, discord.Thread):
-                    logger.warning(f"監視対象のスレッド（ID: {thread_id}）が存在しなくなりました")
-                    return
-                
-                # スレッドがアーカイブされていたら終了
-                if refreshed_thread.archived:
-                    logger.info(f"スレッド '{refreshed_thread.name}' (ID: {thread_id}) はアーカイブされています")
-                    return
-                
-                # 更新されたスレッドオブジェクトを使用
-                thread = refreshed_thread
-                
-            except (discord.NotFound, discord.HTTPException):
-                logger.warning(f"監視対象のスレッド（ID: {thread_id}）が見つかりません")
-                return
-            
-            # スレッドがすでに締め切り状態かチェック
-            if closed_name_template.format(original_name="") in thread.name:
-                is_closed = True
-            
-            # 一定時間待機 (10分ごとにチェック)
-            try:
-                await asyncio.sleep(600)  # 10分待機
-            except asyncio.CancelledError:
-                logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) の監視が中断されました")
-                break
-                
-        # 監視時間終了
         logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) の監視時間が終了しました")
+        
+        # キャッシュ済みの最新のスレッド情報があればそちらを使用
+        cached = bot.get_channel(thread_id)
+        if isinstance(cached, discord.Thread):
+            thread = cached
+        
+        # モニタリング時間終了による締め切り
+        # まずスレッドがまだ締め切られていないことを確認
+        close_marker = _close_marker(closed_name_template)
+        if not (close_marker and close_marker in thread.name):
+            # スレッド名を変更
+            await close_thread(thread, closed_name_template)
+            logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) のモニタリング時間終了により締め切りました")
+        
+        # まだスレッドに参加中なら退出
+        try:
+            # スレッドからBotを退出
+            await thread.leave()
+            logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) から退出しました")
+        except:
+            pass
             
     except Exception as e:
-        logger.error(f"スレッド監視中にエラーが発生しました (ID: {thread_id}): {e}")
+        logger.error(f"スレッド監視終了処理でエラーが発生しました (ID: {thread_id}): {e}")
     
     finally:
-        # タスク終了時の処理
-        try:
-            # スレッドが存在する場合のみ
-            if thread:
-                # モニタリング時間終了による締め切り
-                # まずスレッドがまだ締め切られていないことを確認
-                close_marker = closed_name_template.format(original_name="").strip()
-                if not (close_marker and close_marker in thread.name):
-                    # スレッド名を変更
-                    await close_thread(thread, closed_name_template)
-                    logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) のモニタリング時間終了により締め切りました")
-                
-                # まだスレッドに参加中なら退出
-                try:                 
-                    # スレッドからBotを退出
-                    await thread.leave()
-                    logger.info(f"スレッド '{thread.name}' (ID: {thread_id}) から退出しました")
-                except:
-                    pass
-            
-            # 監視リストから削除
-            if thread_id in monitored_threads:
-                del monitored_threads[thread_id]
-                
-            # デバッグ情報から削除
-            if thread_id in thread_debug_info:
-                del thread_debug_info[thread_id]
-                
-        except Exception as e:
-            logger.error(f"スレッド監視終了処理でエラーが発生しました (ID: {thread_id}): {e}")
+        # 管理情報から削除
+        thread_records.pop(thread_id, None)
+
+def _start_debug_ticker(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    デバッグログ用の共通タイマーを開始（すでに動作中なら何もしない）
+    
+    Args:
+        loop: イベントループ
+    """
+    global _debug_ticker
+    
+    if _debug_ticker is None:
+        _debug_ticker = loop.call_later(DEBUG_LOG_INTERVAL, _debug_tick, loop)
+
+def _debug_tick(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    監視中の全スレッドの残り時間をログ出力し、監視中のスレッドがあれば次回を予約
+    
+    Args:
+        loop: イベントループ
+    """
+    global _debug_ticker
+    _debug_ticker = None
+    
+    current_time = time.time()
+    monitoring = False
+    for thread_id, record in thread_records.items():
+        if record.timer_handle is None:
+            continue
+        monitoring = True
+        
+        # 残り監視時間（分）を計算
+        minutes_to_end_monitoring = max(0, int((record.end_monitoring_time - current_time) / 60))
+        logger.debug(
+            f"スレッド監視中: '{record.name}' (ID: {thread_id}), "
+            f"監視終了まで残り {minutes_to_end_monitoring}分"
+        )
+    
+    if monitoring:
+        _start_debug_ticker(loop)
+
+def _stop_monitoring(record: ThreadRecord) -> bool:
+    """
+    スレッドの監視（監視終了タイマー）だけを中止し、作成者などの管理情報は残す
+    
+    Args:
+        record: 対象スレッドの管理情報
+        
+    Returns:
+        bool: 監視中だった場合はTrue
+    """
+    if record.timer_handle is None:
+        return False
+    # cancel()でコールバックとその参照（bot・スレッド）を即座に解放する
+    # （取り消し済みのエントリはasyncioがスケジュールから掃除する）
+    record.timer_handle.cancel()
+    record.timer_handle = None
+    return True
+
+def _forget_thread(thread_id: int) -> bool:
+    """
+    スレッドの監視を中止し、関連情報を削除
+    
+    Args:
+        thread_id: 対象スレッドのID
+        
+    Returns:
+        bool: 監視中だった場合はTrue
+    """
+    record = thread_records.pop(thread_id, None)
+    if record is None:
+        return False
+    return _stop_monitoring(record)
+
+async def handle_thread_update(before: discord.Thread, after: discord.Thread) -> None:
+    """
+    スレッド更新イベントを処理（アーカイブされたスレッドの監視を終了）
+    
+    アーカイブ後に再開されたスレッドでも作成者チェックが効くよう、作成者情報は残す
+    
+    Args:
+        before: 更新前のスレッド
+        after: 更新後のスレッド
+    """
+    if after.archived and not before.archived:
+        record = thread_records.get(after.id)
+        if record is not None and _stop_monitoring(record):
+            logger.info(f"スレッド '{after.name}' (ID: {after.id}) はアーカイブされたため監視を終了しました")
+
+async def handle_thread_delete(thread: discord.Thread) -> None:
+    """
+    スレッド削除イベントを処理（削除されたスレッドの監視を終了）
+    
+    Args:
+        thread: 削除されたスレッド
+    """
+    if _forget_thread(thread.id):
+        logger.info(f"スレッド '{thread.name}' (ID: {thread.id}) は削除されたため監視を終了しました")
 
 async def process_thread_message(
     message: discord.Message,
@@ -470,15 +623,15 @@ async def process_thread_message(
     thread = message.channel
     
     # 締め切りマーカーに基づいて、すでに締め切られているか確認
-    import re
-    close_marker = closed_name_template.format(original_name="").strip()
+    close_marker = _close_marker(closed_name_template)
     if close_marker and close_marker in thread.name:
         return
     
     # 締め切りキーワードが含まれているかチェック
     if should_close_thread(message, close_keywords):
         # スレッド作成者IDを取得
-        creator_id = thread_creators.get(thread.id)
+        record = thread_records.get(thread.id)
+        creator_id = record.creator_id if record is not None else None
         
         # 作成者のみが締め切れるようにする
         if creator_id and creator_id != message.author.id:
@@ -493,9 +646,7 @@ async def process_thread_message(
         
         if success:            
             # 監視タスクを終了
-            if thread.id in monitored_threads:
-                monitored_threads[thread.id].cancel()
-                del monitored_threads[thread.id]
+            if _forget_thread(thread.id):
                 logger.info(f"スレッド '{thread.name}' (ID: {thread.id}) の監視を終了しました（キーワードによる締め切り）")
                 
             # スレッドからBotを退出
@@ -513,48 +664,66 @@ def get_monitored_threads_status():
         dict: スレッドIDをキーとする状態情報
     """
     current_time = time.time()
-    status = {}
     
-    for thread_id, info in thread_debug_info.items():
-        if thread_id in monitored_threads:
+    return {
+        thread_id: {
+            'name': record.name,
+            'author': record.author,
+            'created_at': record.created_at_str,
             # 監視終了までの残り時間を計算
-            remaining_monitoring = max(0, int((info['end_monitoring_time'] - current_time) / 60))
-            
-            status[thread_id] = {
-                'name': info['name'],
-                'author': info['author'],
-                'created_at': datetime.fromtimestamp(info['created_at']).strftime('%Y-%m-%d %H:%M:%S'),
-                'monitoring_remaining_minutes': remaining_monitoring,
-                'auto_archive_duration': info['auto_archive_duration']
-            }
-    
-    return status
+            'monitoring_remaining_minutes': max(0, int((record.end_monitoring_time - current_time) / 60)),
+            'auto_archive_duration': record.auto_archive_duration
+        }
+        for thread_id, record in thread_records.items()
+        if record.timer_handle is not None
+    }
 
 
 # ボタンクラスとビュー
-class CloseThreadButton(Button):
-    """スレッド締め切りボタン"""
+# 締め切りボタンのcustom_idの接頭辞（close_thread_{スレッドID}_{作成者ID}）
+CLOSE_BUTTON_ID_PREFIX = "close_thread_"
+
+class CloseThreadButton(
+    DynamicItem[Button],
+    template=CLOSE_BUTTON_ID_PREFIX + r'(?P<thread_id>[0-9]+)(?:_(?P<creator_id>[0-9]+))?'
+):
+    """
+    スレッド締め切りボタン
     
-    def __init__(self, thread_id: int, closed_name_template: str, creator_id: int = None):
+    スレッドIDと作成者IDはcustom_idに埋め込み、押されたときにcustom_idから復元する。
+    スレッドごとにボタンやビューをメモリに保持せず、Bot再起動後もボタンが機能する。
+    """
+    
+    def __init__(self, thread_id: int, creator_id: Optional[int] = None):
         """
         ボタンの初期化
         
         Args:
             thread_id: 対象スレッドのID
-            closed_name_template: 締め切り後のスレッド名テンプレート
             creator_id: スレッド作成者のユーザーID
         """
         super().__init__(
-            style=discord.ButtonStyle.danger,  # 赤色のボタン
-            label="募集を締め切る",
-            # 〆切りボタンの絵文字
-            emoji="🔒",
-            custom_id=f"close_thread_{thread_id}"
+            Button(
+                style=discord.ButtonStyle.danger,  # 赤色のボタン
+                label="募集を締め切る",
+                # 〆切りボタンの絵文字
+                emoji="🔒",
+                custom_id=(
+                    f"{CLOSE_BUTTON_ID_PREFIX}{thread_id}_{creator_id}" if creator_id
+                    else f"{CLOSE_BUTTON_ID_PREFIX}{thread_id}"
+                )
+            )
         )
         self.thread_id = thread_id
-        self.closed_name_template = closed_name_template
-        self.creator_id = creator_id  # 作成者IDを保存
+        self.creator_id = creator_id
+        
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match: re.Match):
+        """custom_idからボタンを復元"""
+        creator_id = match['creator_id']
+        return cls(int(match['thread_id']), int(creator_id) if creator_id else None)
         
+
     async def callback(self, interaction: discord.Interaction):
         """ボタンクリック時のコールバック"""
         # スレッドを取得
@@ -565,12 +734,16 @@ class CloseThreadButton(Button):
             return
             
         # すでに締め切られているか確認
-        if self.closed_name_template.format(original_name="") in thread.name:
+        close_marker = _close_marker(THREAD_CLOSED_NAME_TEMPLATE)
+        if close_marker and close_marker in thread.name:
             await interaction.response.send_message("⚠️ このスレッドはすでに締め切られています", ephemeral=True)
             return
             
-        # 作成者IDを取得（ボタンに保存されていない場合はグローバル辞書から取得）
-        creator_id = self.creator_id if self.creator_id else thread_creators.get(thread.id)
+        # 作成者IDを取得（custom_idに含まれていない場合はグローバル辞書から取得）
+        creator_id = self.creator_id
+        if not creator_id:
+            record = thread_records.get(thread.id)
+            creator_id = record.creator_id if record is not None else None
         
         # 作成者以外のユーザーからのリクエストを拒否
         if creator_id and interaction.user.id != creator_id:
@@ -588,12 +761,10 @@ class CloseThreadButton(Button):
             original_name = thread.name
             
             # 「[✅ 募集中]」タグの除去（正規表現を使用）
-            import re
-            recruitment_tag_pattern = re.compile(r'\[✅\s*募集中\]')
-            clean_name = recruitment_tag_pattern.sub('', original_name).strip()
+            clean_name = RECRUITMENT_TAG_PATTERN.sub('', original_name).strip()
             
             # 新しいスレッド名を生成
-            new_name = self.closed_name_template.format(original_name=clean_name)
+            new_name = THREAD_CLOSED_NAME_TEMPLATE.format(original_name=clean_name)
             
             # スレッド名を変更
             await thread.edit(name=new_name)
@@ -634,14 +805,12 @@ class CloseThreadButton(Button):
                         f"実行者: {interaction.user.display_name})")
             
             # ボタンを非アクティブ化
-            self.disabled = True
-            self.label = "締め切り済み"
+            self.item.disabled = True
+            self.item.label = "締め切り済み"
             await interaction.message.edit(view=self.view)
             
             # 監視タスクを終了（オプション）
-            if thread.id in monitored_threads:
-                monitored_threads[thread.id].cancel()
-                del monitored_threads[thread.id]
+            if _forget_thread(thread.id):
                 logger.info(f"スレッド '{new_name}' (ID: {thread.id}) の監視を終了しました（ボタンによる締め切り）")
                 
             # スレッドからBotを退出（オプション）
@@ -660,32 +829,27 @@ class CloseThreadButton(Button):
 class CloseThreadView(View):
     """スレッド締め切りボタンを含むビュー"""
     
-    def __init__(self, thread_id: int, closed_name_template: str, creator_id: int = None):
+    def __init__(self, thread_id: int, creator_id: int = None):
         """
         ビューの初期化
         
         Args:
             thread_id: 対象スレッドのID
-            closed_name_template: 締め切り後のスレッド名テンプレート
             creator_id: スレッド作成者のユーザーID
         """
         super().__init__(timeout=None)  # タイムアウトなし（ボタンは永続的）
         
         # ボタンを追加 - 作成者IDも渡す
-        self.add_item(CloseThreadButton(thread_id, closed_name_template, creator_id))
+        self.add_item(CloseThreadButton(thread_id, creator_id))
 
 
 async def cleanup_thread_data():
     """スレッド関連のデータをクリーンアップ"""
-    global thread_creators, monitored_threads, thread_debug_info
-    
     try:
-        # スレッド作成者情報をクリア
-        thread_creators.clear()
-        
-        # 他のデータもクリア
-        monitored_threads.clear()
-        thread_debug_info.clear()
+        # 監視を中止してから管理情報をクリア
+        for record in thread_records.values():
+            _stop_monitoring(record)
+        thread_records.clear()
         
         logger.info("スレッドデータがクリーンアップされました")
     except Exception as e:
@@ -7,22 +7,31 @@
 import os
 import logging
 from typing import List, Set, Union
-from dotenv import load_dotenv
 
 # ロガー設定
 logger = logging.getLogger("config")
 
+# 真とみなす文字列
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
 # .envファイルを読み込み
-load_dotenv()
+# 環境変数を直接渡す本番環境（docker run --env-file 等）では DISABLE_DOTENV=true で
+# dotenvのインポートと.envの探索・解析を省略できる
+if os.environ.get("DISABLE_DOTENV", "").lower() not in _TRUTHY:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# 環境変数のスナップショット（設定の解決はすべてこの辞書から行う）
+_ENV = dict(os.environ)
 
 def get_env_bool(key: str, default: bool = False) -> bool:
     """環境変数をboolとして取得"""
-    return os.getenv(key, str(default)).lower() in ['true', '1', 'yes', 'on']
+    return _ENV.get(key, str(default)).lower() in _TRUTHY
 
 def get_env_int(key: str, default: int) -> int:
     """環境変数をintとして取得"""
     try:
-        return int(os.getenv(key, default))
+        return int(_ENV.get(key, default))
     except ValueError:
         logger.warning(f"環境変数 {key} の値が不正です。デフォルト値 {default} を使用します")
         return default
@@ -31,20 +40,20 @@ def get_env_list(key: str, default: List[str] = None) -> List[str]:
     """環境変数をリストとして取得（カンマ区切り）"""
     if default is None:
         default = []
-    value = os.getenv(key, "")
+    value = _ENV.get(key, "")
     if not value:
         return default
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in map(str.strip, value.split(",")) if item]
 
 def get_env_set(key: str, default: Set[int] = None) -> Set[int]:
     """環境変数をintのsetとして取得（カンマ区切り）"""
     if default is None:
         default = set()
-    value = os.getenv(key, "")
+    value = _ENV.get(key, "")
     if not value:
         return default
     try:
-        return {int(item.strip()) for item in value.split(",") if item.strip().isdigit()}
+        return {int(item) for item in map(str.strip, value.split(",")) if item.isdigit()}
     except ValueError:
         logger.warning(f"環境変数 {key} の値が不正です。デフォルト値を使用します")
         return default
@@ -52,7 +61,7 @@ def get_env_set(key: str, default: Set[int] = None) -> Set[int]:
 # =============================================================================
 # 基本設定（必須項目）
 # =============================================================================
-DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN") or os.getenv("BOT_TOKEN")
+DISCORD_BOT_TOKEN = _ENV.get("DISCORD_BOT_TOKEN") or _ENV.get("BOT_TOKEN")
 if not DISCORD_BOT_TOKEN:
     raise ValueError("DISCORD_BOT_TOKEN が設定されていません")
 
@@ -60,7 +69,7 @@ if not DISCORD_BOT_TOKEN:
 # ログ設定
 # =============================================================================
 DEBUG_MODE = get_env_bool("DEBUG_MODE")
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
 
 # =============================================================================
 # Discord Bot設定
@@ -70,29 +79,35 @@ ENABLED_CHANNEL_IDS = get_env_set("ENABLED_CHANNEL_IDS")
 ADMIN_USER_IDS = get_env_set("ADMIN_USER_IDS")
 IGNORED_BOT_IDS = get_env_set("IGNORED_BOT_IDS")
 
+# Discord APIが許可する自動アーカイブ時間（分）
+VALID_ARCHIVE_DURATIONS = frozenset((60, 1440, 4320, 10080))
+
 # スレッド設定
 TRIGGER_KEYWORDS = get_env_list("TRIGGER_KEYWORDS", ["募集"])
 THREAD_AUTO_ARCHIVE_DURATION = get_env_int("THREAD_AUTO_ARCHIVE_DURATION", 60)
-THREAD_NAME_TEMPLATE = os.getenv("THREAD_NAME_TEMPLATE", "[✅ 募集中]{username}の募集")
+THREAD_NAME_TEMPLATE = _ENV.get("THREAD_NAME_TEMPLATE", "[✅ 募集中]{username}の募集")
 THREAD_MONITORING_DURATION = get_env_int("THREAD_MONITORING_DURATION", 60)
 
 # スレッド締め切り設定
 THREAD_CLOSE_KEYWORDS = get_env_list("THREAD_CLOSE_KEYWORDS", 
     ["〆", "締め", "しめ", "〆切", "締切", "しめきり", "closed", "close"])
-THREAD_CLOSED_NAME_TEMPLATE = os.getenv("THREAD_CLOSED_NAME_TEMPLATE", "[⛔ 募集終了]{original_name}")
+THREAD_CLOSED_NAME_TEMPLATE = _ENV.get("THREAD_CLOSED_NAME_TEMPLATE", "[⛔ 募集終了]{original_name}")
 
 # =============================================================================
 # スプレッドシート設定
 # =============================================================================
 SPREADSHEET_LOGGING_ENABLED = get_env_bool("SPREADSHEET_LOGGING_ENABLED")
-SPREADSHEET_CREDENTIALS_FILE = os.getenv("SPREADSHEET_CREDENTIALS_FILE", "credentials.json")
-SPREADSHEET_ID = os.getenv("SPREADSHEET_ID", "")
-SPREADSHEET_SHEET_NAME = os.getenv("SPREADSHEET_SHEET_NAME", "スレッドログ")
+SPREADSHEET_CREDENTIALS_FILE = _ENV.get("SPREADSHEET_CREDENTIALS_FILE", "credentials.json")
+SPREADSHEET_ID = _ENV.get("SPREADSHEET_ID", "")
+SPREADSHEET_SHEET_NAME = _ENV.get("SPREADSHEET_SHEET_NAME", "スレッドログ")
 SPREADSHEET_LOG_QUEUE_SIZE = get_env_int("SPREADSHEET_LOG_QUEUE_SIZE", 100)
+SPREADSHEET_LOG_BATCH_SIZE = get_env_int("SPREADSHEET_LOG_BATCH_SIZE", 50)
+SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS = get_env_int("SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS", 500)
+SPREADSHEET_FIXED_VALUE = _ENV.get("SPREADSHEET_FIXED_VALUE", "")
 
 # スレッド状態
-THREAD_STATUS_CREATION = os.getenv("THREAD_STATUS_CREATION", "募集開始")
-THREAD_STATUS_CLOSING = os.getenv("THREAD_STATUS_CLOSING", "募集終了")
+THREAD_STATUS_CREATION = _ENV.get("THREAD_STATUS_CREATION", "募集開始")
+THREAD_STATUS_CLOSING = _ENV.get("THREAD_STATUS_CLOSING", "募集終了")
 
 # 1日1回制限設定
 SPREADSHEET_DAILY_LIMIT_ENABLED = get_env_bool("SPREADSHEET_DAILY_LIMIT_ENABLED", True)
@@ -133,7 +148,7 @@ def validate_config():
         errors.append("DISCORD_BOT_TOKEN が設定されていません")
     
     # 値の範囲チェック
-    if THREAD_AUTO_ARCHIVE_DURATION not in [60, 1440, 4320, 10080]:
+    if THREAD_AUTO_ARCHIVE_DURATION not in VALID_ARCHIVE_DURATIONS:
         errors.append(f"THREAD_AUTO_ARCHIVE_DURATION の値が不正です: {THREAD_AUTO_ARCHIVE_DURATION}")
     
     if not (0 <= SPREADSHEET_DAILY_RESET_HOUR <= 23):
@@ -142,6 +157,12 @@ def validate_config():
     if not (-12 <= SPREADSHEET_TIMEZONE_OFFSET <= 12):
         errors.append(f"SPREADSHEET_TIMEZONE_OFFSET の値が不正です: {SPREADSHEET_TIMEZONE_OFFSET}")
     
+    if SPREADSHEET_LOG_BATCH_SIZE < 1:
+        errors.append(f"SPREADSHEET_LOG_BATCH_SIZE の値が不正です: {SPREADSHEET_LOG_BATCH_SIZE}")
+    
+    if SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS <= 0:
+        errors.append(f"SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS の値が不正です: {SPREADSHEET_LOG_BATCH_MAX_LATENCY_MS}")
+    
     # スプレッドシート設定チェック
     if SPREADSHEET_LOGGING_ENABLED:
         if not SPREADSHEET_ID:
@@ -162,16 +183,20 @@ def validate_config():
 def print_config_summary():
     """設定の概要を表示"""
     if DEBUG_MODE:
-        logger.info("=== Bot設定情報 ===")
-        logger.info(f"デバッグモード: {DEBUG_MODE}")
-        logger.info(f"トリガーキーワード: {TRIGGER_KEYWORDS}")
-        logger.info(f"有効チャンネル数: {len(ENABLED_CHANNEL_IDS)}")
-        logger.info(f"スレッド監視時間: {THREAD_MONITORING_DURATION}分")
-        logger.info(f"スプレッドシートログ: {SPREADSHEET_LOGGING_ENABLED}")
+        # 1レコードにまとめて出力（行ごとにログを出さない）
+        lines = [
+            "=== Bot設定情報 ===",
+            f"デバッグモード: {DEBUG_MODE}",
+            f"トリガーキーワード: {TRIGGER_KEYWORDS}",
+            f"有効チャンネル数: {len(ENABLED_CHANNEL_IDS)}",
+            f"スレッド監視時間: {THREAD_MONITORING_DURATION}分",
+            f"スプレッドシートログ: {SPREADSHEET_LOGGING_ENABLED}",
+        ]
         if SPREADSHEET_LOGGING_ENABLED and SPREADSHEET_DAILY_LIMIT_ENABLED:
             tz_name = "JST" if SPREADSHEET_TIMEZONE_OFFSET == 9 else f"UTC{SPREADSHEET_TIMEZONE_OFFSET:+d}"
-            logger.info(f"1日1回制限: 有効 ({tz_name} {SPREADSHEET_DAILY_RESET_HOUR}:00リセット)")
-        logger.info("==================")
+            lines.append(f"1日1回制限: 有効 ({tz_name} {SPREADSHEET_DAILY_RESET_HOUR}:00リセット)")
+        lines.append("==================")
+        logger.info("\n".join(lines))
 
 # 初期化時に実行
 validate_config()
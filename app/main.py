@@ -11,14 +11,7 @@ import sys
 import traceback
 from datetime import datetime
 
-# 環境変数の読み込み
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
-# ボットと設定をインポート
+# ボットと設定をインポート（.envの読み込みはconfigのインポート時に1回だけ行う）
 from bot.client import ThreadBot
 from config import DISCORD_BOT_TOKEN as BOT_TOKEN, SPREADSHEET_LOGGING_ENABLED
 from utils.logger import setup_logger
@@ -121,10 +121,11 @@ try:
     # 最終ハートビート取得
     def get_last_heartbeat():
         """最終ハートビート時間を取得"""
+        # 存在確認（stat）はせず、直接開いてファイルが無い場合のみ未記録扱いにする
         try:
-            if os.path.exists(heartbeat_file):
-                with open(heartbeat_file, "r") as f:
-                    return f.read().strip()
+            with open(heartbeat_file, "r") as f:
+                return f.read().strip()
+        except FileNotFoundError:
             return "No heartbeat recorded"
         except Exception as e:
             return f"Error reading heartbeat: {e}"
@@ -66,10 +66,10 @@ try:
         """基本的なヘルスチェックエンドポイント"""
         # 最終ハートビート時間を読み取り
         last_heartbeat = "Unknown"
+        # 存在確認（stat）はせず、直接開いて無ければそのまま
         try:
-            if os.path.exists(heartbeat_marker_file):
-                with open(heartbeat_marker_file, "r") as f:
-                    last_heartbeat = f.read().strip()
+            with open(heartbeat_marker_file, "r") as f:
+                last_heartbeat = f.read().strip()
         except Exception:
             pass
             
@@ -8,7 +8,7 @@
 import os
 import gspread
 from google.oauth2.service_account import Credentials
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 import traceback
 import time
@@ -64,6 +64,8 @@ class SpreadsheetClient:
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 3
         self._client = None
+        # 接続時に取得したワークシートを保持し、書き込みごとの再取得を省く
+        self._worksheet = None
         
     def connect(self) -> bool:
         """
@@ -73,13 +75,16 @@ class SpreadsheetClient:
             bool: 接続成功時はTrue
         """
         try:
-            # 認証情報を取得
-            creds = get_creds(self.credentials_file)
-            if creds is None:
-                return False
-                
-            # クライアントを作成
-            self._client = gspread.authorize(creds)
+            # 認証済みクライアントがあれば再利用し、HTTPセッション（keep-alive接続）を維持する
+            # 認証からやり直す場合は reconnect() を使用
+            if self._client is None:
+                # 認証情報を取得
+                creds = get_creds(self.credentials_file)
+                if creds is None:
+                    return False
+                    
+                # クライアントを作成
+                self._client = gspread.authorize(creds)
             
             # スプレッドシートを開く
             spreadsheet = self._client.open_by_key(self.spreadsheet_id)
@@ -104,10 +109,12 @@ class SpreadsheetClient:
                 worksheet.append_row(self._headers)
                 logger.info(f"シート '{self.sheet_name}' を新規作成しました")
             
+            self._worksheet = worksheet
             self._reconnect_attempts = 0
             return True
             
         except Exception as e:
+            self._worksheet = None
             logger.error(f"スプレッドシート接続エラー: {e}")
             return False
     
@@ -124,45 +131,56 @@ class SpreadsheetClient:
         Returns:
             bool: 成功時はTrue
         """
+        return self.add_thread_logs([(user_id, username, fixed_value, status)])
+    
+    def add_thread_logs(self, entries: List[Tuple[str, str, str, str]]) -> bool:
+        """
+        複数のスレッドログを1回のAPI呼び出しでまとめて追加（同期版）
+        
+        Args:
+            entries: (ユーザーID, ユーザー名, 固定値, 状態) のタプルのリスト
+                
+        Returns:
+            bool: 成功時はTrue
+        """
+        if not entries:
+            return True
+        
         # ロックを取得して同時書き込みを防止
         with spreadsheet_lock:
             start_time = time.time()
-            logger.debug(f"add_thread_log開始: ID={user_id}, ユーザー={username}, 状態={status}")
+            logger.debug("add_thread_logs開始: %s件", len(entries))
             
             try:
                 # まだ接続していない場合は接続
-                if self._client is None:
-                    connection_result = self.connect()
-                    if not connection_result:
-                        logger.error("スプレッドシートへの接続に失敗しました")
-                        return False
-                
-                # スプレッドシート・ワークシート取得
-                try:
-                    spreadsheet = self._client.open_by_key(self.spreadsheet_id)
-                    worksheet = spreadsheet.worksheet(self.sheet_name)
-                except Exception as e:
-                    # 接続エラーが発生した場合は再接続を試みる
-                    logger.warning(f"スプレッドシート接続エラー、再接続を試みます: {e}")
-                    if self.connect():
-                        spreadsheet = self._client.open_by_key(self.spreadsheet_id)
-                        worksheet = spreadsheet.worksheet(self.sheet_name)
-                    else:
-                        logger.error("スプレッドシートへの再接続に失敗しました")
-                        return False
+                # 保持中のセッションで接続できない場合は、認証の期限切れや失効に備えて
+                # 認証からやり直す（reconnect()は試行回数の上限で打ち切られる）
+                if self._worksheet is None and not (self.connect() or self.reconnect()):
+                    logger.error("スプレッドシートへの接続に失敗しました")
+                    return False
                 
                 # 現在時刻を取得
                 jst = timezone(timedelta(hours=9))
                 now = datetime.now(jst).strftime('%Y/%m/%d %H:%M:%S')
                 
                 # 行データを作成
-                row_data = [str(user_id), username, now, status, fixed_value]
+                rows = [
+                    [user_id, username, now, status, fixed_value]
+                    for user_id, username, fixed_value, status in entries
+                ]
                 
-                # 行を追加
-                worksheet.append_row(row_data)
+                # 行をまとめて追加
+                # append_rowsは冪等ではない（タイムアウトや5xxでもサーバー側では書き込み済みの場合がある）
+                # ため、その場で再送はしない。ワークシートを破棄し、次回の書き込み時に再接続する
+                try:
+                    self._worksheet.append_rows(rows, value_input_option="RAW")
+                except Exception as e:
+                    logger.error(f"スプレッドシート書き込みエラー、次回の書き込み時に再接続します: {e}")
+                    self._worksheet = None
+                    return False
                 
                 elapsed = time.time() - start_time
-                logger.info(f"スレッドログを記録しました: ユーザーID={user_id}, ユーザー={username}, 状態={status} (所要時間: {elapsed:.2f}秒)")
+                logger.info(f"スレッドログを記録しました: {len(rows)}件 (所要時間: {elapsed:.2f}秒)")
                 return True
                 
             except Exception as e:
@@ -187,6 +205,7 @@ class SpreadsheetClient:
         
         try:
             self._client = None  # 既存のクライアントをクリア
+            self._worksheet = None
             return self.connect()
         except Exception as e:
             logger.error(f"スプレッドシート再接続エラー: {e}")